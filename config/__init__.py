@@ -1,5 +1,18 @@
 """Configuration package for test framework."""
-from .settings import Settings, settings
+from .settings import Settings
 from .test_data import TestData
 
+# Importing the submodule binds `config.settings` to the module object; drop it
+# so the name resolves to the lazily created Settings instance below.
+globals().pop('settings', None)
+
 __all__ = ['Settings', 'settings', 'TestData']
+
+
+def __getattr__(name: str):
+    """Resolve the global settings instance on first access."""
+    if name == 'settings':
+        from .settings import settings as instance
+        globals()['settings'] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,39 @@
 """Centralized configuration management for test framework."""
 import os
 from dataclasses import dataclass
-from typing import Optional
-from dotenv import load_dotenv
+from functools import cached_property, lru_cache
+from typing import Dict, Optional
+from dotenv import dotenv_values
+
+
+@lru_cache(maxsize=None)
+def _load_dotenv(env_file: str) -> Dict[str, Optional[str]]:
+    """Parse environment file once per process.
+
+    Args:
+        env_file: Path to environment file
+
+    Returns:
+        Mapping of variables defined in the file
+    """
+    return dotenv_values(env_file)
+
+
+def _getenv(env: Dict[str, Optional[str]], key: str, default: str) -> str:
+    """Look up a variable, letting the real environment override the file.
+
+    Args:
+        env: Parsed environment file values
+        key: Variable name
+        default: Value used when the variable is not set anywhere
+
+    Returns:
+        Variable value
+    """
+    value = os.environ.get(key)
+    if value is None:
+        value = env.get(key)
+    return default if value is None else value
 
 
 @dataclass
@@ -17,6 +48,7 @@ class Settings:
     headless: bool
     slow_mo: int
     timeout: int
+    navigation_timeout: int
 
     # Viewport settings
     viewport_width: int
@@ -26,6 +58,9 @@ class Settings:
     report_dir: str
     screenshot_dir: str
 
+    # API mocking settings (empty disables HAR replay)
+    api_har: str
+
     @classmethod
     def from_env(cls, env_file: str = '.env.test') -> 'Settings':
         """Load settings from environment file.
@@ -36,55 +71,68 @@ class Settings:
         Returns:
             Settings instance with loaded values
         """
-        load_dotenv(env_file)
+        env = _load_dotenv(env_file)
 
         return cls(
-            base_url=os.getenv('BASE_URL', 'http://localhost:5173'),
-            api_url=os.getenv('API_URL', 'http://localhost:5001/api'),
-            headless=os.getenv('HEADLESS', 'true').lower() == 'false',
-            slow_mo=int(os.getenv('SLOW_MO', '0')),
-            timeout=int(os.getenv('TIMEOUT', '30000')),
-            viewport_width=int(os.getenv('VIEWPORT_WIDTH', '1920')),
-            viewport_height=int(os.getenv('VIEWPORT_HEIGHT', '1080')),
-            report_dir=os.getenv('REPORT_DIR', 'reports'),
-            screenshot_dir=os.getenv('SCREENSHOT_DIR', 'reports/screenshots')
+            base_url=_getenv(env, 'BASE_URL', 'http://localhost:5173'),
+            api_url=_getenv(env, 'API_URL', 'http://localhost:5001/api'),
+            headless=_getenv(env, 'HEADLESS', 'true').lower() == 'false',
+            slow_mo=int(_getenv(env, 'SLOW_MO', '0')),
+            timeout=int(_getenv(env, 'TIMEOUT', '10000')),
+            navigation_timeout=int(_getenv(env, 'NAVIGATION_TIMEOUT', '15000')),
+            viewport_width=int(_getenv(env, 'VIEWPORT_WIDTH', '1920')),
+            viewport_height=int(_getenv(env, 'VIEWPORT_HEIGHT', '1080')),
+            report_dir=_getenv(env, 'REPORT_DIR', 'reports'),
+            screenshot_dir=_getenv(env, 'SCREENSHOT_DIR', 'reports/screenshots'),
+            api_har=_getenv(env, 'API_HAR', '')
         )
 
-    @property
+    @cached_property
     def login_url(self) -> str:
         """Get login page URL."""
         return f"{self.base_url}/login"
 
-    @property
+    @cached_property
     def dashboard_url(self) -> str:
         """Get dashboard page URL."""
         return f"{self.base_url}/dashboard"
 
-    @property
+    @cached_property
     def trading_url(self) -> str:
         """Get trading page URL."""
         return f"{self.base_url}/trading"
 
-    @property
+    @cached_property
     def portfolio_url(self) -> str:
         """Get portfolio page URL."""
         return f"{self.base_url}/portfolio"
 
-    @property
+    @cached_property
     def watchlists_url(self) -> str:
         """Get watchlists page URL."""
         return f"{self.base_url}/watchlists"
 
-    @property
+    @cached_property
     def trades_url(self) -> str:
         """Get trade history page URL."""
         return f"{self.base_url}/trades"
 
-    @property
+    @cached_property
     def register_url(self) -> str:
         """Get registration page URL."""
         return f"{self.base_url}/register"
 
 
-# Global settings instance
-settings = Settings.from_env()
+def __getattr__(name: str):
+    """Create the global settings instance on first access.
+
+    Args:
+        name: Module attribute name
+
+    Returns:
+        Global Settings instance
+    """
+    if name == 'settings':
+        globals()['settings'] = Settings.from_env()
+        return globals()['settings']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
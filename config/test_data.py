@@ -1,5 +1,6 @@
 """Test data management for test framework."""
-from typing import List
+from functools import cache
+from typing import Final, Tuple
 from models.user import User
 
 
@@ -25,14 +26,22 @@ class TestData:
         name='Bob Johnson'
     )
 
+    # Invalid credentials for negative testing
+    INVALID_USER = User(
+        email='invalid@example.com',
+        password='wrongpassword',
+        name='Invalid User'
+    )
+
     @classmethod
-    def get_all_users(cls) -> List[User]:
+    @cache
+    def get_all_users(cls) -> Tuple[User, ...]:
         """Get all test users.
 
         Returns:
-            List of all test users
+            Tuple of all test users
         """
-        return [cls.PRIMARY_USER, cls.SECONDARY_USER, cls.TERTIARY_USER]
+        return (cls.PRIMARY_USER, cls.SECONDARY_USER, cls.TERTIARY_USER)
 
     @classmethod
     def get_invalid_user(cls) -> User:
@@ -41,16 +50,12 @@ class TestData:
         Returns:
             User with invalid credentials
         """
-        return User(
-            email='invalid@example.com',
-            password='wrongpassword',
-            name='Invalid User'
-        )
+        return cls.INVALID_USER
 
     # Stock symbols for testing
-    STOCK_SYMBOLS = ['AAPL', 'GOOGL', 'MSFT', 'TSLA', 'NVDA', 'AMZN', 'META']
+    STOCK_SYMBOLS: Final[Tuple[str, ...]] = ('AAPL', 'GOOGL', 'MSFT', 'TSLA', 'NVDA', 'AMZN', 'META')
 
     # Trade amounts for testing
-    DEFAULT_TRADE_QUANTITY = 10
-    LARGE_TRADE_QUANTITY = 100
-    SMALL_TRADE_QUANTITY = 1
+    DEFAULT_TRADE_QUANTITY: Final = 10
+    LARGE_TRADE_QUANTITY: Final = 100
+    SMALL_TRADE_QUANTITY: Final = 1
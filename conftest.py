@@ -1,45 +1,94 @@
 """Pytest configuration and fixtures using OOP architecture.
 
-This file has been extended to support session-auth for tests marked with the
-`trading` marker. When trading tests are present in the test session we create
-and reuse a Playwright storage state file so the application is logged in once
-and available to tests that require authentication.
+This file has been extended to support session-auth. When tests that use the
+`authenticated_page` fixture are present in the test session we create and
+reuse a Playwright storage state file so the application is logged in once and
+available to every test that requires authentication. All other tests get a
+fresh, empty browser context.
 """
+import os
+import re
 import pytest
-from typing import Optional
-from playwright.sync_api import Page, BrowserContext
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+from playwright.sync_api import Page, BrowserContext, Route
 from config import settings, TestData
-from pages import LoginPage, DashboardPage
+from pages import LoginPage, DashboardPage, PortfolioPage, TradeHistoryPage
 
 #TODO: make wait for visible default based on config settings -> also config based on env
 #TODO: add reportportal logging
 #TODO: add screenshot on failure
 #TODO: parse non pythonic test case names in reports
 
+# localStorage key the application stores the session token under
+AUTH_TOKEN_KEY = 'token'
+
+# Static assets worth serving from memory instead of re-downloading per test
+STATIC_ASSET_RE = re.compile(r'\.(?:js|css|woff2?|png|svg|webp)(?:\?.*)?$')
+
+# Third-party analytics and tracking hosts (including subdomains) aborted in tests
+TRACKER_URL_RE = re.compile(
+    r'^https?://(?:[^/?#]+\.)?'
+    r'(?:google-analytics\.com|googletagmanager\.com|segment\.(?:io|com)|sentry\.io|hotjar\.com|doubleclick\.net)'
+    r'(?:[:/?#]|$)'
+)
+
+# Per-process cache of static asset responses: url -> (status, headers, body)
+_static_cache: Dict[str, Tuple[int, Dict[str, str], bytes]] = {}
+
+
+def _serve_static_asset(route: Route):
+    """Fulfill a static asset request from the in-memory cache.
+
+    The asset is fetched from the server on the first request and reused by
+    every later context in the session. Unsuccessful responses are passed
+    through without being cached.
+    """
+    url = route.request.url
+    cached = _static_cache.get(url)
+    if cached is None:
+        response = route.fetch()
+        if not response.ok:
+            route.fulfill(response=response)
+            return
+        cached = _static_cache[url] = (response.status, response.headers, response.body())
+
+    status, headers, body = cached
+    route.fulfill(status=status, headers=headers, body=body)
+
+
+def _has_auth_token(context: BrowserContext) -> bool:
+    """Check if the context already holds a session token for the application.
+
+    Reads the context storage state instead of navigating, so the check costs a
+    single protocol call.
+    """
+    base = urlsplit(settings.base_url)
+    origin = f"{base.scheme}://{base.netloc}"
+    for entry in context.storage_state()['origins']:
+        if entry['origin'] == origin:
+            return any(item['name'] == AUTH_TOKEN_KEY for item in entry['localStorage'])
+    return False
+
 
 def pytest_collection_modifyitems(config, items):
-    # Check if there are tests that are NOT marked with 'login'
+    # Check if there are tests that request an authenticated page
     # This implies we have functional tests that need a session
-    config.needs_login = any(not item.get_closest_marker("login") for item in items)
+    config.needs_login = any('authenticated_page' in item.fixturenames for item in items)
 
 
 @pytest.fixture(scope='session')
-def storage_state(tmp_path_factory, playwright, pytestconfig) -> Optional[str]:
+def storage_state(tmp_path_factory, browser, browser_context_args, pytestconfig) -> Optional[str]:
     if not getattr(pytestconfig, 'needs_login', False):
         return None
 
-    # Use a context manager for the browser to ensure it closes
-    browser = playwright.chromium.launch(headless=settings.headless)
-    
+    # Reuse the session browser; only the login context is closed afterwards
+    context = browser.new_context(**browser_context_args)
+
     try:
-        context = browser.new_context(
-            base_url=settings.base_url,
-            viewport={'width': settings.viewport_width, 'height': settings.viewport_height}
-        )
         page = context.new_page()
-        page.goto("/")
+        page.goto("/", wait_until="domcontentloaded")
 
-        from pages.login_page import LoginPage
         login_page = LoginPage(page)
         
         # Add a timeout or check to ensure we actually need to log in
@@ -51,12 +100,17 @@ def storage_state(tmp_path_factory, playwright, pytestconfig) -> Optional[str]:
         return str(state_file)
     
     finally:
-        browser.close()
+        context.close()
 
 @pytest.fixture(scope='session')
-def browser_context_args(browser_context_args, storage_state: Optional[str]):
-    """Configure browser context arguments using settings and optional storage state."""
-    args = {
+def browser_context_args(browser_context_args):
+    """Configure browser context arguments using settings.
+
+    Session-scoped so the contexts this conftest creates itself are built from
+    the same arguments as the plugin's per-test context, including the video
+    and device options.
+    """
+    return {
         **browser_context_args,
         'viewport': {
             'width': settings.viewport_width,
@@ -65,13 +119,23 @@ def browser_context_args(browser_context_args, storage_state: Optional[str]):
         'base_url': settings.base_url,
     }
 
-    # If a storage state file was generated for the session, instruct Playwright
-    # to initialize contexts with it. This makes pages authenticated from the
-    # moment they are created.
-    if storage_state:
-        args['storage_state'] = storage_state
 
-    return args
+@pytest.fixture(autouse=True)
+def authenticated_context_args(storage_state: Optional[str], request):
+    """Start contexts of tests using `authenticated_page` from the session storage state.
+
+    The state is passed through the plugin's `browser_context_args` marker, so
+    only those tests are authenticated from the moment their page is created;
+    every other test gets an empty context. Arguments from a marker on the test
+    itself take precedence.
+    """
+    if storage_state and 'authenticated_page' in request.fixturenames:
+        marker = request.node.get_closest_marker('browser_context_args')
+        kwargs = marker.kwargs if marker else {}
+        request.node.add_marker(
+            pytest.mark.browser_context_args(storage_state=storage_state, **kwargs),
+            append=False
+        )
 
 
 @pytest.fixture(scope='session')
@@ -88,44 +152,98 @@ def browser_type_launch_args(browser_type_launch_args):
 def page(page: Page):
     """Configure page with default timeout from settings."""
     page.set_default_timeout(settings.timeout)
+    page.set_default_navigation_timeout(settings.navigation_timeout)
+    yield page
+
+
+@pytest.fixture(scope='module')
+def unauth_page(browser, browser_context_args):
+    """Fixture that provides one unauthenticated page shared by a test module.
+
+    For read-only checks that never log in, such as protected-route redirects,
+    so the browser context is created once per module instead of per test.
+    Per-test `browser_context_args` markers do not apply to this shared context.
+    """
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+    page.set_default_timeout(settings.timeout)
+    page.set_default_navigation_timeout(settings.navigation_timeout)
+
     yield page
 
+    context.close()
+
 
 @pytest.fixture
 def authenticated_page(page: Page):
     """Fixture that provides an authenticated page with logged-in user.
 
-    Uses Page Object Model for authentication.
+    The page's context is created from the session `storage_state`, so the user
+    is already logged in and no per-test UI login is performed. The page is
+    yielded without navigating when the session token is present; tests
+    navigate to the page they exercise themselves. Static assets are served
+    from a session-wide cache after their first download, and third-party
+    analytics requests are aborted.
     """
-    login_page = LoginPage(page)
-    dashboard_page = DashboardPage(page)
-
-    # Navigate to base URL
-    page.goto(settings.base_url)
+    page.context.route(STATIC_ASSET_RE, _serve_static_asset)
+    # Registered last so it wins over the asset cache for tracker scripts
+    page.context.route(TRACKER_URL_RE, lambda route: route.abort())
 
-    # Check if we're redirected to login page, if so perform login
-    if '/login' in page.url:
-        # Perform login using Page Object
-        login_page.login(TestData.PRIMARY_USER, wait_for_redirect=True)
+    if not _has_auth_token(page.context):
+        # Navigate to base URL and make sure we were not sent to the login page
+        page.goto(settings.base_url, wait_until="domcontentloaded")
+        assert '/login' not in page.url, "Session storage state should provide an authenticated page"
 
     yield page
 
-    # Cleanup: logout after test
-    try:
-        dashboard_page.logout()
-    except Exception:
-        pass  # Already logged out or page closed
 
+@pytest.fixture(scope='session')
+def api_har(browser, browser_context_args, storage_state: Optional[str]) -> Optional[str]:
+    """Provide the HAR file `mocked_page` replays API calls from.
 
-@pytest.fixture(autouse=True)
-def clear_storage(context: BrowserContext, request):
-    """Clear browser storage before each test unless the test is marked `trading`.
+    If `API_HAR` points to a missing file, it is recorded here once per session
+    by visiting every page the `mocked_page` tests render. The recording is
+    written to a process-specific file and moved into place atomically, so
+    parallel workers never read or overwrite a partial recording.
+    """
+    if not settings.api_har:
+        return None
+
+    if not os.path.exists(settings.api_har):
+        recording = f"{settings.api_har}.{os.getpid()}.tmp"
+        context = browser.new_context(**browser_context_args, storage_state=storage_state)
+
+        try:
+            context.route_from_har(recording, url=f"{settings.api_url}/**", update=True)
+            page = context.new_page()
+            page.set_default_timeout(settings.timeout)
+            page.set_default_navigation_timeout(settings.navigation_timeout)
+
+            for page_class in (DashboardPage, PortfolioPage, TradeHistoryPage):
+                page_class(page).navigate()
+        finally:
+            # Closing the context writes the recording
+            context.close()
+
+        os.replace(recording, settings.api_har)
 
-    Trading tests rely on session-authenticated storage state and therefore must
-    not have their cookies/local storage cleared between tests; non-trading
-    tests continue to get a clean context.
+    return settings.api_har
+
+
+@pytest.fixture
+def mocked_page(authenticated_page: Page, api_har: Optional[str]):
+    """Fixture that provides an authenticated page with API calls served from a HAR file.
+
+    Meant for read-only tests that only assert rendering. When `API_HAR` is set,
+    requests to the API are replayed from the session recording; requests
+    missing from it fall through to the network. Without `API_HAR` this is the
+    plain authenticated page.
     """
-    if request.node.get_closest_marker('trading') is None:
-        # Only clear cookies for non-trading tests
-        context.clear_cookies()
-    yield
+    if api_har:
+        authenticated_page.route_from_har(
+            api_har,
+            url=f"{settings.api_url}/**",
+            not_found='fallback'
+        )
+
+    yield authenticated_page
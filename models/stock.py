@@ -1,9 +1,24 @@
 """Stock model for test framework."""
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Optional
 
 
-@dataclass
+# Keys emitted by Stock.to_dict, in order
+_DICT_FIELDS = (
+    'symbol',
+    'name',
+    'price',
+    'quantity',
+    'value',
+    'cost_basis',
+    'profit_loss',
+    'profit_loss_percentage'
+)
+_get_dict_values = attrgetter(*_DICT_FIELDS)
+
+
+@dataclass(slots=True)
 class Stock:
     """Stock model representing a stock position."""
 
@@ -16,10 +31,23 @@ class Stock:
     profit_loss: Optional[float] = None
     profit_loss_percentage: Optional[float] = None
 
-    def __post_init__(self):
-        """Validate stock data after initialization."""
-        if not self.symbol:
+    @classmethod
+    def validated(cls, **kwargs) -> 'Stock':
+        """Create stock and validate its data.
+
+        Args:
+            **kwargs: Stock field values
+
+        Returns:
+            Validated Stock instance
+
+        Raises:
+            ValueError: If symbol is empty
+        """
+        stock = cls(**kwargs)
+        if not stock.symbol:
             raise ValueError("Symbol cannot be empty")
+        return stock
 
     def to_dict(self) -> dict:
         """Convert stock to dictionary.
@@ -27,16 +55,7 @@ class Stock:
         Returns:
             Dictionary representation of stock
         """
-        return {
-            'symbol': self.symbol,
-            'name': self.name,
-            'price': self.price,
-            'quantity': self.quantity,
-            'value': self.value,
-            'cost_basis': self.cost_basis,
-            'profit_loss': self.profit_loss,
-            'profit_loss_percentage': self.profit_loss_percentage
-        }
+        return dict(zip(_DICT_FIELDS, _get_dict_values(self)))
 
     def __repr__(self) -> str:
         """String representation of stock."""
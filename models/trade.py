@@ -1,17 +1,31 @@
 """Trade model for test framework."""
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from operator import attrgetter
+from typing import List, Optional
 from datetime import datetime
 
 
+# Keys emitted by Trade.to_dict, in order
+_DICT_FIELDS = (
+    'symbol',
+    'quantity',
+    'trade_type',
+    'price',
+    'total_amount',
+    'timestamp',
+    'fees'
+)
+_get_dict_values = attrgetter(*_DICT_FIELDS)
+
+
 class TradeType(Enum):
     """Trade type enumeration."""
     BUY = "BUY"
     SELL = "SELL"
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Trade model representing a stock trade."""
 
@@ -23,12 +37,25 @@ class Trade:
     timestamp: Optional[datetime] = None
     fees: Optional[float] = None
 
-    def __post_init__(self):
-        """Validate trade data after initialization."""
-        if not self.symbol:
+    @classmethod
+    def validated(cls, **kwargs) -> 'Trade':
+        """Create trade and validate its data.
+
+        Args:
+            **kwargs: Trade field values
+
+        Returns:
+            Validated Trade instance
+
+        Raises:
+            ValueError: If symbol is empty or quantity is not positive
+        """
+        trade = cls(**kwargs)
+        if not trade.symbol:
             raise ValueError("Symbol cannot be empty")
-        if self.quantity <= 0:
+        if trade.quantity <= 0:
             raise ValueError("Quantity must be positive")
+        return trade
 
     def to_dict(self) -> dict:
         """Convert trade to dictionary.
@@ -36,15 +63,34 @@ class Trade:
         Returns:
             Dictionary representation of trade
         """
-        return {
-            'symbol': self.symbol,
-            'quantity': self.quantity,
-            'trade_type': self.trade_type.value,
-            'price': self.price,
-            'total_amount': self.total_amount,
-            'timestamp': self.timestamp.isoformat() if self.timestamp else None,
-            'fees': self.fees
-        }
+        data = dict(zip(_DICT_FIELDS, _get_dict_values(self)))
+        data['trade_type'] = self.trade_type.value
+        if self.timestamp:
+            data['timestamp'] = self.timestamp.isoformat()
+        return data
+
+    @classmethod
+    def to_dicts(cls, trades: List['Trade']) -> List[dict]:
+        """Convert several trades to dictionaries.
+
+        Args:
+            trades: Trades to convert
+
+        Returns:
+            Dictionary representations of trades, in the same order
+        """
+        fields = _DICT_FIELDS
+        get_values = _get_dict_values
+        isoformat = datetime.isoformat
+        result = []
+        append = result.append
+        for trade in trades:
+            data = dict(zip(fields, get_values(trade)))
+            data['trade_type'] = trade.trade_type.value
+            if trade.timestamp:
+                data['timestamp'] = isoformat(trade.timestamp)
+            append(data)
+        return result
 
     def __repr__(self) -> str:
         """String representation of trade."""
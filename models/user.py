@@ -1,9 +1,15 @@
 """User model for test framework."""
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Optional
 
 
-@dataclass
+# Keys emitted by User.to_dict, in order (token is deliberately excluded)
+_DICT_FIELDS = ('email', 'password', 'name')
+_get_dict_values = attrgetter(*_DICT_FIELDS)
+
+
+@dataclass(slots=True)
 class User:
     """User model representing a test user."""
 
@@ -12,13 +18,26 @@ class User:
     name: str
     token: Optional[str] = None
 
-    def __post_init__(self):
-        """Validate user data after initialization."""
-        if not self.email:
+    @classmethod
+    def validated(cls, **kwargs) -> 'User':
+        """Create user and validate its data.
+
+        Args:
+            **kwargs: User field values
+
+        Returns:
+            Validated User instance
+
+        Raises:
+            ValueError: If email or password is empty
+        """
+        user = cls(**kwargs)
+        if not user.email:
             raise ValueError("Email cannot be empty")
-        if not self.password:
+        if not user.password:
             raise ValueError("Password cannot be empty")
         # Name is optional for some test scenarios
+        return user
 
     def to_dict(self) -> dict:
         """Convert user to dictionary.
@@ -26,11 +45,7 @@ class User:
         Returns:
             Dictionary representation of user
         """
-        return {
-            'email': self.email,
-            'password': self.password,
-            'name': self.name
-        }
+        return dict(zip(_DICT_FIELDS, _get_dict_values(self)))
 
     def __repr__(self) -> str:
         """String representation of user (hides password)."""
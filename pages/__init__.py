@@ -1,11 +1,15 @@
 """Page Object Model package for test framework."""
-from .base_page import BasePage
-from .login_page import LoginPage
-from .dashboard_page import DashboardPage
-from .trading_page import TradingPage
-from .portfolio_page import PortfolioPage
-from .watchlist_page import WatchlistPage
-from .trade_history_page import TradeHistoryPage
+import importlib
+
+_PAGE_MODULES = {
+    'BasePage': '.base_page',
+    'LoginPage': '.login_page',
+    'DashboardPage': '.dashboard_page',
+    'TradingPage': '.trading_page',
+    'PortfolioPage': '.portfolio_page',
+    'WatchlistPage': '.watchlist_page',
+    'TradeHistoryPage': '.trade_history_page',
+}
 
 __all__ = [
     'BasePage',
@@ -16,3 +20,22 @@ __all__ = [
     'WatchlistPage',
     'TradeHistoryPage'
 ]
+
+
+def __getattr__(name: str):
+    """Import page object classes on first access."""
+    module_name = _PAGE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        page_class = getattr(importlib.import_module(module_name, __name__), name)
+    except AttributeError as exc:
+        # Keep a failing submodule import from looking like a missing attribute
+        raise ImportError(f"failed to import {name!r} from {__name__!r}: {exc}") from exc
+    globals()[name] = page_class
+    return page_class
+
+
+def __dir__():
+    """List lazily imported page objects alongside module attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,39 @@
 """Base page object with common functionality."""
-from typing import Optional
-from playwright.sync_api import Page, Locator, expect
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Sequence, Union
+from playwright.sync_api import Page, Locator
+from playwright.sync_api import expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from config.settings import settings
+import json
 import re
 
 
+_NUMBER_STRIP_RE = re.compile(r'[^0-9.\-]')
+
+# In-browser counterpart of extract_number_from_text for the first element;
+# the strip pattern is shared so both sides clean text identically
+_EXTRACT_NUMBER_JS = """els => {
+    const text = els.length ? els[0].textContent : null;
+    if (!text) return null;
+    const cleaned = text.replace(new RegExp(%s, 'g'), '');
+    if (!cleaned) return 0;
+    const value = parseFloat(cleaned);
+    return Number.isNaN(value) ? null : value;
+}""" % json.dumps(_NUMBER_STRIP_RE.pattern)
+
+
 class BasePage:
     """Base page object that all page objects inherit from."""
 
+    __slots__ = ('page', 'settings', 'timeout', '_locators')
+
+    # Timeout for clicks on elements that may legitimately be absent
+    OPTIONAL_CLICK_TIMEOUT = 2000
+
+    # Timeout for reads of elements that were already confirmed present
+    PROBE_TIMEOUT = 500
+
     def __init__(self, page: Page):
         """Initialize base page.
 
@@ -17,16 +43,25 @@ class BasePage:
         self.page = page
         self.settings = settings
         self.timeout = settings.timeout
+        self._locators: Dict[str, Locator] = {}
 
     # Navigation methods
-    def goto(self, url: str, wait_until: str = 'networkidle'):
+    def goto(self, url: str, wait_until: str = 'domcontentloaded'):
         """Navigate to URL.
 
         Args:
             url: URL to navigate to
             wait_until: Wait condition (load, domcontentloaded, networkidle)
         """
-        self.page.goto(url, wait_until=wait_until, timeout=self.timeout)
+        self.page.goto(url, wait_until=wait_until, timeout=self.settings.navigation_timeout)
+
+    def reload(self, wait_until: str = 'domcontentloaded'):
+        """Reload current page.
+
+        Args:
+            wait_until: Wait condition (load, domcontentloaded, networkidle)
+        """
+        self.page.reload(wait_until=wait_until, timeout=self.settings.navigation_timeout)
 
     def wait_for_url(self, url: str, timeout: Optional[int] = None):
         """Wait for page to navigate to specific URL.
@@ -54,9 +89,25 @@ class BasePage:
             selector: CSS selector or text selector
 
         Returns:
-            Playwright Locator
+            Playwright Locator (cached per page object)
         """
-        return self.page.locator(selector)
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def text_selector(text: str) -> str:
+        """Build exact text selector.
+
+        Args:
+            text: Text to match exactly
+
+        Returns:
+            Selector string (cached per text)
+        """
+        return f'text="{text}"'
 
     def find_by_text(self, text: str, exact: bool = False) -> Locator:
         """Find element by text content.
@@ -82,6 +133,30 @@ class BasePage:
         """
         return self.page.get_by_role(role, **kwargs)
 
+    def find_link(self, names: Sequence[str]) -> Locator:
+        """Find link by accessible name.
+
+        Args:
+            names: Accepted link names (case-insensitive substring match)
+
+        Returns:
+            Playwright Locator matching a link with any of the names
+        """
+        locator = self.page.get_by_role('link', name=names[0])
+        for name in names[1:]:
+            locator = locator.or_(self.page.get_by_role('link', name=name))
+        return locator
+
+    def click_link(self, names: Sequence[str], timeout: Optional[int] = None):
+        """Click first link matching any of the accessible names.
+
+        Args:
+            names: Accepted link names (case-insensitive substring match)
+            timeout: Timeout in milliseconds
+        """
+        timeout = timeout or self.timeout
+        self.find_link(names).first.click(timeout=timeout)
+
     def click(self, selector: str, timeout: Optional[int] = None):
         """Click element.
 
@@ -92,6 +167,26 @@ class BasePage:
         timeout = timeout or self.timeout
         self.page.click(selector, timeout=timeout)
 
+    def click_first_if_present(self, selector: str, timeout: Optional[int] = None) -> bool:
+        """Click first matching element, skipping it if it does not appear.
+
+        Relies on Playwright's actionability checks instead of counting
+        elements first, so a present element costs a single round-trip.
+
+        Args:
+            selector: Element selector
+            timeout: Timeout in milliseconds (defaults to OPTIONAL_CLICK_TIMEOUT)
+
+        Returns:
+            True if element was clicked, False if it did not appear in time
+        """
+        timeout = timeout or self.OPTIONAL_CLICK_TIMEOUT
+        try:
+            self.find_element(selector).first.click(timeout=timeout)
+        except PlaywrightTimeoutError:
+            return False
+        return True
+
     def fill(self, selector: str, value: str, timeout: Optional[int] = None):
         """Fill input field.
 
@@ -103,27 +198,31 @@ class BasePage:
         timeout = timeout or self.timeout
         self.page.fill(selector, value, timeout=timeout)
 
-    def get_text(self, selector: str) -> Optional[str]:
+    def get_text(self, selector: str, timeout: Optional[int] = None) -> Optional[str]:
         """Get text content from element.
 
         Args:
             selector: Element selector
+            timeout: Timeout in milliseconds
 
         Returns:
             Text content or None
         """
-        return self.page.locator(selector).text_content()
+        timeout = timeout or self.timeout
+        return self.find_element(selector).text_content(timeout=timeout)
 
-    def get_value(self, selector: str) -> str:
+    def get_value(self, selector: str, timeout: Optional[int] = None) -> str:
         """Get input value.
 
         Args:
             selector: Input selector
+            timeout: Timeout in milliseconds
 
         Returns:
             Input value
         """
-        return self.page.locator(selector).input_value()
+        timeout = timeout or self.timeout
+        return self.find_element(selector).input_value(timeout=timeout)
 
     # Wait methods
     def wait_for_element(self, selector: str, state: str = 'visible', timeout: Optional[int] = None):
@@ -137,6 +236,29 @@ class BasePage:
         timeout = timeout or self.timeout
         self.page.wait_for_selector(selector, state=state, timeout=timeout)
 
+    def wait_until_visible(self, selectors: List[str], timeout: Optional[int] = None) -> bool:
+        """Wait for any of the elements to become visible.
+
+        Returns as soon as one element is visible instead of sleeping for a
+        fixed time.
+
+        Args:
+            selectors: Element selectors
+            timeout: Timeout in milliseconds
+
+        Returns:
+            True if an element became visible, False on timeout
+        """
+        timeout = timeout or self.timeout
+        locator = self.find_element(selectors[0])
+        for selector in selectors[1:]:
+            locator = locator.or_(self.find_element(selector))
+        try:
+            locator.locator('visible=true').first.wait_for(state='attached', timeout=timeout)
+        except PlaywrightTimeoutError:
+            return False
+        return True
+
     def wait_for_timeout(self, timeout: int):
         """Wait for specified timeout.
 
@@ -165,7 +287,46 @@ class BasePage:
         Returns:
             True if visible, False otherwise
         """
-        return self.page.locator(selector).is_visible()
+        return self.find_element(selector).is_visible()
+
+    def any_visible(self, selectors: List[str]) -> bool:
+        """Check if any of the elements is visible in a single round-trip.
+
+        Args:
+            selectors: Element selectors
+
+        Returns:
+            True if at least one element is visible, False otherwise
+        """
+        locator = self.find_element(selectors[0])
+        for selector in selectors[1:]:
+            locator = locator.or_(self.find_element(selector))
+        return locator.locator('visible=true').count() > 0
+
+    def all_visible(self, selectors: List[str]) -> bool:
+        """Check if all of the elements are visible in a single round-trip.
+
+        Args:
+            selectors: Element selectors
+
+        Returns:
+            True if every element is visible, False otherwise
+        """
+        return self._all_visible_locator(selectors).count() > 0
+
+    def _all_visible_locator(self, selectors: List[str]) -> Locator:
+        """Build a locator that matches only while all elements are visible.
+
+        Args:
+            selectors: Element selectors
+
+        Returns:
+            Locator for the document root filtered by each visible element
+        """
+        locator = self.page.locator('html')
+        for selector in selectors:
+            locator = locator.filter(has=self.find_element(selector).locator('visible=true'))
+        return locator
 
     def is_enabled(self, selector: str) -> bool:
         """Check if element is enabled.
@@ -176,7 +337,7 @@ class BasePage:
         Returns:
             True if enabled, False otherwise
         """
-        return self.page.locator(selector).is_enabled()
+        return self.find_element(selector).is_enabled()
 
     def element_count(self, selector: str) -> int:
         """Count elements matching selector.
@@ -187,7 +348,20 @@ class BasePage:
         Returns:
             Number of matching elements
         """
-        return self.page.locator(selector).count()
+        return self.find_element(selector).count()
+
+    def element_exists(self, selector: str) -> bool:
+        """Check if at least one element matches selector.
+
+        Does not wait for the element to appear.
+
+        Args:
+            selector: Element selector
+
+        Returns:
+            True if an element matches, False otherwise
+        """
+        return self.element_count(selector) > 0
 
     # Assertion helpers
     def expect_visible(self, selector: str, timeout: Optional[int] = None):
@@ -195,20 +369,33 @@ class BasePage:
 
         Args:
             selector: Element selector
-            timeout: Timeout in milliseconds
+            timeout: Timeout in milliseconds (defaults to settings timeout)
         """
         timeout = timeout or self.timeout
-        expect(self.page.locator(selector)).to_be_visible(timeout=timeout)
+        expect(self.find_element(selector)).to_be_visible(timeout=timeout)
+
+    def expect_all_visible(self, selectors: List[str], timeout: Optional[int] = None):
+        """Assert all elements are visible with a single auto-waiting assertion.
+
+        Args:
+            selectors: Element selectors
+            timeout: Timeout in milliseconds (defaults to settings timeout)
+        """
+        timeout = timeout or self.timeout
+        expect(
+            self._all_visible_locator(selectors),
+            f"Expected all of {selectors} to be visible"
+        ).to_be_attached(timeout=timeout)
 
     def expect_hidden(self, selector: str, timeout: Optional[int] = None):
         """Assert element is hidden.
 
         Args:
             selector: Element selector
-            timeout: Timeout in milliseconds
+            timeout: Timeout in milliseconds (defaults to settings timeout)
         """
         timeout = timeout or self.timeout
-        expect(self.page.locator(selector)).to_be_hidden(timeout=timeout)
+        expect(self.find_element(selector)).to_be_hidden(timeout=timeout)
 
     def expect_text(self, selector: str, text: str, timeout: Optional[int] = None):
         """Assert element contains text.
@@ -216,17 +403,17 @@ class BasePage:
         Args:
             selector: Element selector
             text: Expected text
-            timeout: Timeout in milliseconds
+            timeout: Timeout in milliseconds (defaults to settings timeout)
         """
         timeout = timeout or self.timeout
-        expect(self.page.locator(selector)).to_contain_text(text, timeout=timeout)
+        expect(self.find_element(selector)).to_contain_text(text, timeout=timeout)
 
-    def expect_url(self, url: str, timeout: Optional[int] = None):
+    def expect_url(self, url: Union[str, Pattern[str]], timeout: Optional[int] = None):
         """Assert page URL matches pattern.
 
         Args:
-            url: Expected URL or pattern
-            timeout: Timeout in milliseconds
+            url: Expected URL, or a regular expression searched in the URL
+            timeout: Timeout in milliseconds (defaults to settings timeout)
         """
         timeout = timeout or self.timeout
         expect(self.page).to_have_url(url, timeout=timeout)
@@ -254,7 +441,21 @@ class BasePage:
         Returns:
             Storage value or None
         """
-        return self.page.evaluate(f'localStorage.getItem("{key}")')
+        return self.page.evaluate('key => localStorage.getItem(key)', key)
+
+    def get_local_storage_items(self, keys: Sequence[str]) -> Dict[str, Optional[str]]:
+        """Get several items from local storage in one call.
+
+        Args:
+            keys: Storage keys
+
+        Returns:
+            Mapping of each key to its storage value or None
+        """
+        return self.page.evaluate(
+            'keys => Object.fromEntries(keys.map(key => [key, localStorage.getItem(key)]))',
+            list(keys)
+        )
 
     def set_local_storage_item(self, key: str, value: str):
         """Set item in local storage.
@@ -263,7 +464,7 @@ class BasePage:
             key: Storage key
             value: Storage value
         """
-        self.page.evaluate(f'localStorage.setItem("{key}", "{value}")')
+        self.page.evaluate('([key, value]) => localStorage.setItem(key, value)', [key, value])
 
     def clear_local_storage(self):
         """Clear all local storage."""
@@ -279,9 +480,22 @@ class BasePage:
         Returns:
             Extracted number
         """
-        cleaned = re.sub(r'[^0-9.-]', '', text)
+        if not text:
+            return 0.0
+        cleaned = _NUMBER_STRIP_RE.sub('', text)
         return float(cleaned) if cleaned else 0.0
 
+    def get_visible_number(self, selector: str) -> Optional[float]:
+        """Extract number from the first visible matching element in one round-trip.
+
+        Args:
+            selector: Element selector
+
+        Returns:
+            Extracted number, or None if no element is visible or it has no text
+        """
+        return self.find_element(selector).locator('visible=true').evaluate_all(_EXTRACT_NUMBER_JS)
+
     def wait_for_api_response(self, url_pattern: str, timeout: Optional[int] = None):
         """Wait for specific API response.
 
@@ -7,18 +7,22 @@ from .base_page import BasePage
 class DashboardPage(BasePage):
     """Dashboard page object with dashboard-specific functionality."""
 
-    # Locators
-    DASHBOARD_HEADER = 'text=/dashboard/i'
-    LOGOUT_BUTTON = 'text=Logout'
-    PORTFOLIO_VALUE = 'text=/portfolio value|total value/i'
-    CASH_BALANCE = 'text=/cash balance|available cash/i'
-    PROFIT_LOSS = 'text=/profit|loss|p&l/i'
-    TOP_POSITIONS = 'text=/top positions|holdings/i'
+    __slots__ = ('url',)
+
+    # Locators (plain case-insensitive text)
+    DASHBOARD_HEADER = ':text("dashboard")'
+    LOGOUT_BUTTON = ':text("Logout")'
+    PORTFOLIO_VALUE = ':text("portfolio value"), :text("total value")'
+    CASH_BALANCE = ':text("cash balance"), :text("available cash")'
+    PROFIT_LOSS = ':text("profit"), :text("loss"), :text("p&l")'
+    TOP_POSITIONS = ':text("top positions"), :text("holdings")'
     NAVIGATION_MENU = 'nav'
-    TRADING_LINK = 'text=/trading|trade stocks/i'
-    PORTFOLIO_LINK = 'text=/portfolio/i'
-    WATCHLISTS_LINK = 'text=/watchlist/i'
-    TRADES_LINK = 'text=/trades|trade history/i'
+
+    # Navigation link accessible names
+    TRADING_LINK = ('trading', 'trade stocks')
+    PORTFOLIO_LINK = ('portfolio',)
+    WATCHLISTS_LINK = ('watchlist',)
+    TRADES_LINK = ('trades', 'trade history')
 
     def __init__(self, page: Page):
         """Initialize dashboard page.
@@ -30,9 +34,9 @@ class DashboardPage(BasePage):
         self.url = self.settings.dashboard_url
 
     def navigate(self):
-        """Navigate to dashboard page."""
+        """Navigate to dashboard page and wait for the portfolio summary."""
         self.goto(self.url)
-        self.wait_for_url('/dashboard')
+        self.wait_until_visible([self.PORTFOLIO_VALUE, self.CASH_BALANCE])
 
     def is_loaded(self) -> bool:
         """Check if dashboard page is fully loaded.
@@ -40,10 +44,7 @@ class DashboardPage(BasePage):
         Returns:
             True if page is loaded, False otherwise
         """
-        return (
-            self.is_visible(self.DASHBOARD_HEADER) and
-            self.is_visible(self.LOGOUT_BUTTON)
-        )
+        return self.all_visible([self.DASHBOARD_HEADER, self.LOGOUT_BUTTON])
 
     def logout(self):
         """Logout from application."""
@@ -61,23 +62,19 @@ class DashboardPage(BasePage):
     # Navigation methods
     def navigate_to_trading(self):
         """Navigate to trading page."""
-        self.click(self.TRADING_LINK)
-        self.wait_for_url('/trading')
+        self.click_link(self.TRADING_LINK)
 
     def navigate_to_portfolio(self):
         """Navigate to portfolio page."""
-        self.click(self.PORTFOLIO_LINK)
-        self.wait_for_url('/portfolio')
+        self.click_link(self.PORTFOLIO_LINK)
 
     def navigate_to_watchlists(self):
         """Navigate to watchlists page."""
-        self.click(self.WATCHLISTS_LINK)
-        self.wait_for_url('/watchlists')
+        self.click_link(self.WATCHLISTS_LINK)
 
     def navigate_to_trades(self):
         """Navigate to trade history page."""
-        self.click(self.TRADES_LINK)
-        self.wait_for_url('/trades')
+        self.click_link(self.TRADES_LINK)
 
     # Portfolio metrics methods
     def is_portfolio_summary_displayed(self) -> bool:
@@ -86,10 +83,7 @@ class DashboardPage(BasePage):
         Returns:
             True if portfolio summary is visible, False otherwise
         """
-        return (
-            self.is_visible(self.PORTFOLIO_VALUE) or
-            self.is_visible(self.CASH_BALANCE)
-        )
+        return self.any_visible([self.PORTFOLIO_VALUE, self.CASH_BALANCE])
 
     def get_portfolio_value(self) -> Optional[float]:
         """Get portfolio value.
@@ -97,10 +91,7 @@ class DashboardPage(BasePage):
         Returns:
             Portfolio value or None
         """
-        if self.is_visible(self.PORTFOLIO_VALUE):
-            text = self.get_text(self.PORTFOLIO_VALUE)
-            return self.extract_number_from_text(text) if text else None
-        return None
+        return self.get_visible_number(self.PORTFOLIO_VALUE)
 
     def get_cash_balance(self) -> Optional[float]:
         """Get cash balance.
@@ -108,10 +99,7 @@ class DashboardPage(BasePage):
         Returns:
             Cash balance or None
         """
-        if self.is_visible(self.CASH_BALANCE):
-            text = self.get_text(self.CASH_BALANCE)
-            return self.extract_number_from_text(text) if text else None
-        return None
+        return self.get_visible_number(self.CASH_BALANCE)
 
     def is_top_positions_displayed(self) -> bool:
         """Check if top positions section is displayed.
@@ -119,7 +107,7 @@ class DashboardPage(BasePage):
         Returns:
             True if top positions is visible, False otherwise
         """
-        return self.is_visible(self.TOP_POSITIONS)
+        return self.element_exists(self.TOP_POSITIONS)
 
     def is_navigation_visible(self) -> bool:
         """Check if navigation menu is visible.
@@ -1,20 +1,27 @@
 """Login page object."""
+import re
 from typing import Optional
 from playwright.sync_api import Page
 from .base_page import BasePage
 from models.user import User
 
 
+# Matches the login route path, ignoring query string and fragment
+_LOGIN_PATH_RE = re.compile(r'/login(?:[/?#]|$)')
+
+
 class LoginPage(BasePage):
     """Login page object with login-specific functionality."""
 
+    __slots__ = ('url',)
+
     # Locators as class constants
     EMAIL_INPUT = 'input[type="email"]'
     PASSWORD_INPUT = 'input[type="password"]'
     SUBMIT_BUTTON = 'button[type="submit"]'
-    ERROR_MESSAGE = 'text=/invalid credentials|user not found|invalid password|invalid email or password/i'
-    REGISTER_LINK = 'text=/sign up|register|create account/i'
-    LOGIN_LINK = 'text=/sign in|login|already have/i'
+    ERROR_MESSAGE = ':text("invalid credentials"), :text("user not found"), :text("invalid password"), :text("invalid email or password")'
+    REGISTER_LINK = ':text("sign up"), :text("register"), :text("create account")'
+    LOGIN_LINK = ':text("sign in"), :text("login"), :text("already have")'
 
     def __init__(self, page: Page):
         """Initialize login page.
@@ -26,9 +33,9 @@ class LoginPage(BasePage):
         self.url = self.settings.login_url
 
     def navigate(self):
-        """Navigate to login page."""
+        """Navigate to login page and wait for the login form."""
         self.goto(self.url)
-        self.wait_for_url('/login')
+        self.wait_until_visible([self.EMAIL_INPUT])
 
     def is_loaded(self) -> bool:
         """Check if login page is fully loaded.
@@ -36,11 +43,7 @@ class LoginPage(BasePage):
         Returns:
             True if page is loaded, False otherwise
         """
-        return (
-            self.is_visible(self.EMAIL_INPUT) and
-            self.is_visible(self.PASSWORD_INPUT) and
-            self.is_visible(self.SUBMIT_BUTTON)
-        )
+        return self.all_visible([self.EMAIL_INPUT, self.PASSWORD_INPUT, self.SUBMIT_BUTTON])
 
     def fill_email(self, email: str):
         """Fill email input field.
@@ -69,12 +72,7 @@ class LoginPage(BasePage):
             user: User object with email and password
             wait_for_redirect: Whether to wait for redirect to dashboard
         """
-        self.fill_email(user.email)
-        self.fill_password(user.password)
-        self.click_submit()
-
-        if wait_for_redirect:
-            self.wait_for_url('/dashboard', timeout=self.timeout)
+        self.login_with_credentials(user.email, user.password, wait_for_redirect)
 
     def login_with_credentials(self, email: str, password: str, wait_for_redirect: bool = True):
         """Perform login with email and password.
@@ -84,8 +82,12 @@ class LoginPage(BasePage):
             password: Password
             wait_for_redirect: Whether to wait for redirect to dashboard
         """
-        user = User(email=email, password=password, name='')
-        self.login(user, wait_for_redirect)
+        self.fill_email(email)
+        self.fill_password(password)
+        self.click_submit()
+
+        if wait_for_redirect:
+            self.wait_for_url('/dashboard', timeout=self.settings.navigation_timeout)
 
     def is_error_displayed(self) -> bool:
         """Check if error message is displayed.
@@ -102,7 +104,7 @@ class LoginPage(BasePage):
             Error message text or None
         """
         if self.is_error_displayed():
-            return self.get_text(self.ERROR_MESSAGE)
+            return self.get_text(self.ERROR_MESSAGE, timeout=self.PROBE_TIMEOUT)
         return None
 
     def navigate_to_register(self):
@@ -116,19 +118,17 @@ class LoginPage(BasePage):
         Returns:
             True if on login page, False otherwise
         """
-        return '/login' in self.get_current_url()
+        return _LOGIN_PATH_RE.search(self.page.url) is not None
 
     # Validation methods
     def expect_login_page_loaded(self):
         """Assert that login page is loaded."""
-        self.expect_visible(self.EMAIL_INPUT)
-        self.expect_visible(self.PASSWORD_INPUT)
-        self.expect_visible(self.SUBMIT_BUTTON)
+        self.expect_all_visible([self.EMAIL_INPUT, self.PASSWORD_INPUT, self.SUBMIT_BUTTON])
 
     def expect_error_message(self):
         """Assert that error message is displayed."""
         self.expect_visible(self.ERROR_MESSAGE, timeout=5000)
 
     def expect_on_login_page(self):
-        """Assert that we are on login page."""
-        self.expect_url('/login')
+        """Assert that we are on login page, with or without a query string."""
+        self.expect_url(_LOGIN_PATH_RE)
@@ -8,18 +8,20 @@ from models.stock import Stock
 class PortfolioPage(BasePage):
     """Portfolio page object with portfolio-specific functionality."""
 
+    __slots__ = ('url',)
+
     # Locators
-    PAGE_HEADER = 'text=/portfolio/i'
-    POSITION_ROW = '[data-testid="position-row"], tr'
-    STOCK_SYMBOL = 'text=/AAPL|GOOGL|MSFT|TSLA|NVDA/i'
-    QUANTITY_CELL = 'text=/shares|qty/i'
-    VALUE_CELL = 'text=/value|\$/i'
-    PROFIT_LOSS_CELL = 'text=/p&l|profit|loss/i'
-    COST_BASIS_CELL = 'text=/cost basis|avg cost/i'
-    TRADE_BUTTON = 'button:has-text(/trade/i)'
-    STOCK_DETAILS_BUTTON = 'button:has-text(/details|view/i)'
-    PORTFOLIO_METRICS = 'text=/total value|portfolio value/i'
-    EMPTY_STATE = 'text=/no positions|no holdings|empty/i'
+    PAGE_HEADER = ':text("portfolio")'
+    POSITION_ROW = '[data-testid="position-row"], table > tbody > tr'
+    STOCK_SYMBOL = ':text("AAPL"), :text("GOOGL"), :text("MSFT"), :text("TSLA"), :text("NVDA")'
+    QUANTITY_CELL = ':text("shares"), :text("qty")'
+    VALUE_CELL = ':text("value"), :text("$")'
+    PROFIT_LOSS_CELL = ':text("p&l"), :text("profit"), :text("loss")'
+    COST_BASIS_CELL = ':text("cost basis"), :text("avg cost")'
+    TRADE_BUTTON = 'button:has-text("trade")'
+    STOCK_DETAILS_BUTTON = 'button:has-text("details"), button:has-text("view")'
+    PORTFOLIO_METRICS = ':text("total value"), :text("portfolio value")'
+    EMPTY_STATE = ':text("no positions"), :text("no holdings"), :text("empty")'
 
     def __init__(self, page: Page):
         """Initialize portfolio page.
@@ -31,9 +33,17 @@ class PortfolioPage(BasePage):
         self.url = self.settings.portfolio_url
 
     def navigate(self):
-        """Navigate to portfolio page."""
+        """Navigate to portfolio page and wait for positions or empty state."""
         self.goto(self.url)
-        self.wait_for_url('/portfolio')
+        self.wait_for_content()
+
+    def wait_for_content(self) -> bool:
+        """Wait until the positions or the empty state are rendered.
+
+        Returns:
+            True if content appeared, False on timeout
+        """
+        return self.wait_until_visible([self.STOCK_SYMBOL, self.EMPTY_STATE])
 
     def is_loaded(self) -> bool:
         """Check if portfolio page is fully loaded.
@@ -49,7 +59,7 @@ class PortfolioPage(BasePage):
         Returns:
             True if positions are visible, False otherwise
         """
-        return self.element_count(self.STOCK_SYMBOL) > 0
+        return self.element_exists(self.STOCK_SYMBOL)
 
     def get_position_count(self) -> int:
         """Get number of positions displayed.
@@ -65,7 +75,7 @@ class PortfolioPage(BasePage):
         Returns:
             True if empty state is visible, False otherwise
         """
-        return self.is_visible(self.EMPTY_STATE)
+        return self.element_exists(self.EMPTY_STATE)
 
     def are_metrics_displayed(self) -> bool:
         """Check if portfolio metrics are displayed.
@@ -73,7 +83,7 @@ class PortfolioPage(BasePage):
         Returns:
             True if metrics are visible, False otherwise
         """
-        return self.is_visible(self.PORTFOLIO_METRICS)
+        return self.element_exists(self.PORTFOLIO_METRICS)
 
     def get_portfolio_value(self) -> Optional[float]:
         """Get portfolio value from metrics.
@@ -81,10 +91,7 @@ class PortfolioPage(BasePage):
         Returns:
             Portfolio value or None
         """
-        if self.are_metrics_displayed():
-            text = self.get_text(self.PORTFOLIO_METRICS)
-            return self.extract_number_from_text(text) if text else None
-        return None
+        return self.get_visible_number(self.PORTFOLIO_METRICS)
 
     def are_trade_buttons_visible(self) -> bool:
         """Check if trade buttons are visible for positions.
@@ -92,7 +99,7 @@ class PortfolioPage(BasePage):
         Returns:
             True if trade buttons are visible, False otherwise
         """
-        return self.element_count(self.TRADE_BUTTON) > 0
+        return self.element_exists(self.TRADE_BUTTON)
 
     def click_trade_button_for_position(self, index: int = 0):
         """Click trade button for specific position.
@@ -102,12 +109,12 @@ class PortfolioPage(BasePage):
         """
         buttons = self.find_element(self.TRADE_BUTTON)
         if buttons.count() > index:
-            buttons.nth(index).click()
+            buttons.nth(index).click(timeout=self.timeout)
 
     def refresh_page(self):
-        """Refresh portfolio page."""
-        self.page.reload()
-        self.wait_for_load_state('networkidle')
+        """Refresh portfolio page and wait for positions or empty state."""
+        self.reload()
+        self.wait_for_content()
 
     # Validation methods
     def expect_portfolio_page_loaded(self):
@@ -1,24 +1,55 @@
 """Trade history page object."""
 from typing import List, Optional
 from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from .base_page import BasePage
 
 
+# Presence bits for a trade type (1) and symbol (2) as the exact text of an
+# element inside the given trade rows
+_TRADE_TEXT_PRESENCE_JS = """(rows, [tradeType, symbol]) => {
+    const hasText = (row, text) =>
+        [row, ...row.querySelectorAll('*')].some(el => el.textContent.trim() === text);
+    let present = 0;
+    for (const row of rows) {
+        if (hasText(row, tradeType)) present |= 1;
+        if (hasText(row, symbol)) present |= 2;
+    }
+    return present;
+}"""
+
+# Snapshot of the sort state: aria-sort indicators first, then the row order
+_SORT_STATE_JS = """rowSelector => JSON.stringify([
+    Array.from(document.querySelectorAll('[aria-sort]'), el => el.getAttribute('aria-sort')),
+    Array.from(document.querySelectorAll(rowSelector), el => el.innerText),
+])"""
+
+# True once the sort state differs from a snapshot taken with _SORT_STATE_JS
+_SORT_STATE_CHANGED_JS = "([rowSelector, before]) => (" + _SORT_STATE_JS + ")(rowSelector) !== before"
+
+
 class TradeHistoryPage(BasePage):
     """Trade history page object with trade history-specific functionality."""
 
+    __slots__ = ('url',)
+
+    # Upper bound for a sort to show up; "no change" is a valid outcome when the
+    # app has no aria-sort indicator and the rows were already in order, so this
+    # never exceeds the fixed wait it replaced
+    SORT_SETTLE_TIMEOUT = 1000
+
     # Locators
-    PAGE_HEADER = 'text=/trade history|trades/i'
-    TRADE_ROW = '[data-testid="trade-row"], tr'
-    TRADE_TYPE = 'text=/BUY|SELL/i'
-    STOCK_SYMBOL = 'text=/AAPL|GOOGL|MSFT|TSLA|NVDA/i'
+    PAGE_HEADER = ':text("trade history"), :text("trades")'
+    TRADE_ROW = '[data-testid="trade-row"], table > tbody > tr'
+    TRADE_TYPE = ':text("BUY"), :text("SELL")'
+    STOCK_SYMBOL = ':text("AAPL"), :text("GOOGL"), :text("MSFT"), :text("TSLA"), :text("NVDA")'
     QUANTITY_CELL = 'td:has-text("shares"), td'
-    PRICE_CELL = 'text=/\$/i'
-    TIMESTAMP_CELL = 'text=/ago|AM|PM|:/i'
-    SORT_BUTTON = 'button:has-text(/sort|date/i)'
-    FILTER_BUTTON = 'button:has-text(/filter/i)'
-    PAGINATION = 'text=/page|next|previous/i'
-    EMPTY_STATE = 'text=/no trades|no history|empty/i'
+    PRICE_CELL = ':text("$")'
+    TIMESTAMP_CELL = ':text("ago"), :text("AM"), :text("PM"), :text(":")'
+    SORT_BUTTON = 'button:has-text("sort"), button:has-text("date")'
+    FILTER_BUTTON = 'button:has-text("filter")'
+    PAGINATION = ':text("page"), :text("next"), :text("previous")'
+    EMPTY_STATE = ':text("no trades"), :text("no history"), :text("empty")'
 
     def __init__(self, page: Page):
         """Initialize trade history page.
@@ -30,9 +61,17 @@ class TradeHistoryPage(BasePage):
         self.url = self.settings.trades_url
 
     def navigate(self):
-        """Navigate to trade history page."""
+        """Navigate to trade history page and wait for trades or empty state."""
         self.goto(self.url)
-        self.wait_for_url('/trades')
+        self.wait_for_content()
+
+    def wait_for_content(self) -> bool:
+        """Wait until the trades or the empty state are rendered.
+
+        Returns:
+            True if content appeared, False on timeout
+        """
+        return self.wait_until_visible([self.TRADE_TYPE, self.EMPTY_STATE])
 
     def is_loaded(self) -> bool:
         """Check if trade history page is fully loaded.
@@ -40,8 +79,7 @@ class TradeHistoryPage(BasePage):
         Returns:
             True if page is loaded, False otherwise
         """
-        self.wait_for_timeout(2000)
-        return self.is_visible(self.PAGE_HEADER)
+        return self.wait_until_visible([self.PAGE_HEADER])
 
     def are_trades_displayed(self) -> bool:
         """Check if trades are displayed.
@@ -49,7 +87,7 @@ class TradeHistoryPage(BasePage):
         Returns:
             True if trades are visible, False otherwise
         """
-        return self.element_count(self.TRADE_TYPE) > 0
+        return self.element_exists(self.TRADE_TYPE)
 
     def get_trade_count(self) -> int:
         """Get number of trades displayed.
@@ -65,7 +103,7 @@ class TradeHistoryPage(BasePage):
         Returns:
             True if empty state is visible, False otherwise
         """
-        return self.is_visible(self.EMPTY_STATE)
+        return self.element_exists(self.EMPTY_STATE)
 
     def is_trade_type_displayed(self, trade_type: str) -> bool:
         """Check if specific trade type is displayed.
@@ -76,7 +114,7 @@ class TradeHistoryPage(BasePage):
         Returns:
             True if trade type is visible, False otherwise
         """
-        return self.is_visible(f'text="{trade_type}"')
+        return self.element_exists(self.text_selector(trade_type))
 
     def is_symbol_displayed(self, symbol: str) -> bool:
         """Check if specific symbol is displayed.
@@ -87,7 +125,7 @@ class TradeHistoryPage(BasePage):
         Returns:
             True if symbol is visible, False otherwise
         """
-        return self.is_visible(f'text="{symbol}"')
+        return self.element_exists(self.text_selector(symbol))
 
     def are_timestamps_displayed(self) -> bool:
         """Check if timestamps are displayed.
@@ -95,7 +133,7 @@ class TradeHistoryPage(BasePage):
         Returns:
             True if timestamps are visible, False otherwise
         """
-        return self.element_count(self.TIMESTAMP_CELL) > 0
+        return self.element_exists(self.TIMESTAMP_CELL)
 
     def is_sort_button_visible(self) -> bool:
         """Check if sort button is visible.
@@ -106,10 +144,19 @@ class TradeHistoryPage(BasePage):
         return self.is_visible(self.SORT_BUTTON)
 
     def click_sort(self):
-        """Click sort button."""
+        """Click sort button and wait for the sort indicator or row order to change."""
         if self.is_sort_button_visible():
+            before = self.page.evaluate(_SORT_STATE_JS, self.TRADE_ROW)
             self.click(self.SORT_BUTTON)
-            self.wait_for_timeout(1000)
+            try:
+                self.page.wait_for_function(
+                    _SORT_STATE_CHANGED_JS,
+                    arg=[self.TRADE_ROW, before],
+                    timeout=self.SORT_SETTLE_TIMEOUT
+                )
+            except PlaywrightTimeoutError:
+                # Nothing observable changed: already sorted and no indicator
+                pass
 
     def is_pagination_visible(self) -> bool:
         """Check if pagination is visible.
@@ -120,9 +167,9 @@ class TradeHistoryPage(BasePage):
         return self.is_visible(self.PAGINATION)
 
     def refresh_page(self):
-        """Refresh trade history page."""
-        self.page.reload()
-        self.wait_for_load_state('networkidle')
+        """Refresh trade history page and wait for trades or empty state."""
+        self.reload()
+        self.wait_for_content()
 
     # Validation methods
     def expect_trade_history_page_loaded(self):
@@ -141,8 +188,13 @@ class TradeHistoryPage(BasePage):
             trade_type: Trade type (BUY or SELL)
             symbol: Stock symbol
         """
-        assert self.is_trade_type_displayed(trade_type), f"{trade_type} trade should be displayed"
-        assert self.is_symbol_displayed(symbol), f"Symbol {symbol} should be displayed"
+        present = self.find_element(self.TRADE_ROW).evaluate_all(_TRADE_TEXT_PRESENCE_JS, [trade_type, symbol])
+        assert present & 1, f"{trade_type} trade should be displayed"
+        assert present & 2, f"Symbol {symbol} should be displayed"
+
+    def expect_sort_button_visible(self):
+        """Assert that sort button is visible."""
+        self.expect_visible(self.SORT_BUTTON)
 
     def expect_empty_state(self):
         """Assert that empty state is displayed."""
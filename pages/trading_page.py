@@ -8,17 +8,19 @@ from models.trade import Trade, TradeType
 class TradingPage(BasePage):
     """Trading page object with trading-specific functionality."""
 
+    __slots__ = ('url',)
+
     # Locators
-    PAGE_HEADER = 'text=/trading|trade stocks/i'
+    PAGE_HEADER = ':text("trading"), :text("trade stocks")'
     TRADE_BUTTON = 'button:has-text("Trade")'
     BUY_BUTTON = 'text=BUY'
     SELL_BUTTON = 'text=SELL'
     QUANTITY_INPUT = 'input[type="number"]'
-    EXECUTE_BUTTON = 'button:has-text(/execute|buy|sell|confirm/i)'
-    CANCEL_BUTTON = 'button:has-text(/cancel|close/i)'
-    SUCCESS_MESSAGE = 'text=/success|completed|executed/i'
-    ERROR_MESSAGE = 'text=/error|failed|insufficient/i'
-    STOCK_SYMBOLS = 'text=/AAPL|GOOGL|MSFT|TSLA|NVDA/i'
+    EXECUTE_BUTTON = 'button:has-text("execute"), button:has-text("buy"), button:has-text("sell"), button:has-text("confirm")'
+    CANCEL_BUTTON = 'button:has-text("cancel"), button:has-text("close")'
+    SUCCESS_MESSAGE = ':text("success"), :text("completed"), :text("executed")'
+    ERROR_MESSAGE = ':text("error"), :text("failed"), :text("insufficient")'
+    STOCK_SYMBOLS = ':text("AAPL"), :text("GOOGL"), :text("MSFT"), :text("TSLA"), :text("NVDA")'
 
     def __init__(self, page: Page):
         """Initialize trading page.
@@ -30,9 +32,9 @@ class TradingPage(BasePage):
         self.url = self.settings.trading_url
 
     def navigate(self):
-        """Navigate to trading page."""
+        """Navigate to trading page and wait for the stock list's trade buttons."""
         self.goto(self.url)
-        self.wait_for_url('/trading')
+        self.wait_until_visible([self.TRADE_BUTTON])
 
     def is_loaded(self) -> bool:
         """Check if trading page is fully loaded.
@@ -40,8 +42,7 @@ class TradingPage(BasePage):
         Returns:
             True if page is loaded, False otherwise
         """
-        self.wait_for_timeout(2000)  # Wait for stocks to load
-        return self.is_visible(self.PAGE_HEADER)
+        return self.wait_until_visible([self.PAGE_HEADER])
 
     def are_stocks_displayed(self) -> bool:
         """Check if stocks are displayed.
@@ -49,7 +50,7 @@ class TradingPage(BasePage):
         Returns:
             True if stocks are visible, False otherwise
         """
-        return self.element_count(self.STOCK_SYMBOLS) > 0
+        return self.element_exists(self.STOCK_SYMBOLS)
 
     def are_trade_buttons_visible(self) -> bool:
         """Check if trade buttons are visible.
@@ -57,14 +58,12 @@ class TradingPage(BasePage):
         Returns:
             True if trade buttons are visible, False otherwise
         """
-        return self.element_count(self.TRADE_BUTTON) > 0
+        return self.element_exists(self.TRADE_BUTTON)
 
     def click_first_trade_button(self):
         """Click the first trade button."""
-        self.wait_for_timeout(2000)
-        if self.are_trade_buttons_visible():
-            self.find_element(self.TRADE_BUTTON).first.click()
-            self.wait_for_timeout(1000)
+        # Stocks load asynchronously, so allow the full timeout for the button
+        self.click_first_if_present(self.TRADE_BUTTON, timeout=self.timeout)
 
     def click_trade_button_for_symbol(self, symbol: str):
         """Click trade button for specific stock symbol.
@@ -72,9 +71,9 @@ class TradingPage(BasePage):
         Args:
             symbol: Stock symbol (e.g., 'AAPL')
         """
-        button_selector = f'button:has-text("Trade"):near(text="{symbol}")'
-        self.click(button_selector)
-        self.wait_for_timeout(1000)
+        row_selector = f'[data-symbol="{symbol}"], tr:has-text("{symbol}")'
+        row = self.find_element(row_selector).first
+        row.locator(self.TRADE_BUTTON).first.click(timeout=self.timeout)
 
     def is_trade_modal_open(self) -> bool:
         """Check if trade modal is open.
@@ -82,7 +81,7 @@ class TradingPage(BasePage):
         Returns:
             True if modal is open, False otherwise
         """
-        return self.is_visible(self.BUY_BUTTON) and self.is_visible(self.SELL_BUTTON)
+        return self.all_visible([self.BUY_BUTTON, self.SELL_BUTTON])
 
     def select_buy(self):
         """Select BUY option in trade modal."""
@@ -98,18 +97,16 @@ class TradingPage(BasePage):
         Args:
             quantity: Number of shares
         """
-        if self.element_count(self.QUANTITY_INPUT) > 0:
+        if self.element_exists(self.QUANTITY_INPUT):
             self.fill(self.QUANTITY_INPUT, str(quantity))
 
     def click_execute(self):
         """Click execute button to submit trade."""
-        if self.element_count(self.EXECUTE_BUTTON) > 0:
-            self.find_element(self.EXECUTE_BUTTON).first.click()
+        self.click_first_if_present(self.EXECUTE_BUTTON)
 
     def click_cancel(self):
         """Click cancel button to close modal."""
-        if self.element_count(self.CANCEL_BUTTON) > 0:
-            self.find_element(self.CANCEL_BUTTON).first.click()
+        self.click_first_if_present(self.CANCEL_BUTTON)
 
     def execute_buy_trade(self, quantity: int, wait_for_success: bool = True):
         """Execute a buy trade.
@@ -124,7 +121,7 @@ class TradingPage(BasePage):
         self.click_execute()
 
         if wait_for_success:
-            self.wait_for_timeout(2000)
+            self.wait_for_trade_result()
 
     def execute_sell_trade(self, quantity: int, wait_for_success: bool = True):
         """Execute a sell trade.
@@ -139,7 +136,15 @@ class TradingPage(BasePage):
         self.click_execute()
 
         if wait_for_success:
-            self.wait_for_timeout(2000)
+            self.wait_for_trade_result()
+
+    def wait_for_trade_result(self) -> bool:
+        """Wait for the trade success or error message.
+
+        Returns:
+            True if a result message appeared, False on timeout
+        """
+        return self.wait_until_visible([self.SUCCESS_MESSAGE, self.ERROR_MESSAGE])
 
     def execute_trade(self, trade: Trade, wait_for_success: bool = True):
         """Execute a trade using Trade model.
@@ -175,7 +180,7 @@ class TradingPage(BasePage):
         Returns:
             True if quantity input is visible, False otherwise
         """
-        return self.element_count(self.QUANTITY_INPUT) > 0
+        return self.element_exists(self.QUANTITY_INPUT)
 
     def is_execute_button_visible(self) -> bool:
         """Check if execute button is visible.
@@ -183,7 +188,7 @@ class TradingPage(BasePage):
         Returns:
             True if execute button is visible, False otherwise
         """
-        return self.element_count(self.EXECUTE_BUTTON) > 0
+        return self.element_exists(self.EXECUTE_BUTTON)
 
     # Validation methods
     def expect_trading_page_loaded(self):
@@ -193,13 +198,11 @@ class TradingPage(BasePage):
 
     def expect_stocks_displayed(self):
         """Assert that stocks are displayed."""
-        self.wait_for_timeout(2000)
-        assert self.are_stocks_displayed(), "Stocks should be displayed"
+        assert self.wait_until_visible([self.STOCK_SYMBOLS]), "Stocks should be displayed"
 
     def expect_trade_modal_open(self):
         """Assert that trade modal is open."""
-        self.expect_visible(self.BUY_BUTTON)
-        self.expect_visible(self.SELL_BUTTON)
+        self.expect_all_visible([self.BUY_BUTTON, self.SELL_BUTTON])
 
     def expect_trade_form_elements(self):
         """Assert that trade form elements are visible."""
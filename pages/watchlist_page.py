@@ -1,25 +1,29 @@
 """Watchlist page object."""
 from typing import Optional
 from playwright.sync_api import Page
-from .base_page import BasePage
+from .base_page import BasePage, expect
 
 
 class WatchlistPage(BasePage):
     """Watchlist page object with watchlist-specific functionality."""
 
+    __slots__ = ('url',)
+
     # Locators
-    PAGE_HEADER = 'text=/watchlist/i'
-    CREATE_WATCHLIST_BUTTON = 'button:has-text(/create|new watchlist/i)'
+    PAGE_HEADER = ':text("watchlist")'
+    CREATE_WATCHLIST_BUTTON = 'button:has-text("create"), button:has-text("new watchlist")'
     WATCHLIST_NAME_INPUT = 'input[type="text"], input[placeholder*="name"]'
-    SAVE_BUTTON = 'button:has-text(/save|create/i)'
-    CANCEL_BUTTON = 'button:has-text(/cancel|close/i)'
+    SAVE_BUTTON = 'button:has-text("save"), button:has-text("create")'
+    CANCEL_BUTTON = 'button:has-text("cancel"), button:has-text("close")'
     WATCHLIST_ITEM = '[data-testid="watchlist-item"], .watchlist-item'
-    ADD_STOCK_BUTTON = 'button:has-text(/add stock|add/i)'
+    ADD_STOCK_BUTTON = 'button:has-text("add")'
     STOCK_SYMBOL_INPUT = 'input[placeholder*="symbol"], input[placeholder*="stock"]'
-    REMOVE_STOCK_BUTTON = 'button:has-text(/remove|delete/i)'
-    DELETE_WATCHLIST_BUTTON = 'button:has-text(/delete watchlist/i)'
-    SUCCESS_MESSAGE = 'text=/success|added|created/i'
-    ERROR_MESSAGE = 'text=/error|failed|already exists/i'
+    REMOVE_STOCK_BUTTON = ':is(button:has-text("remove"), button:has-text("delete")):not(:has-text("watchlist"))'
+    # Relative to a remove button: the enclosing list item or table row of its stock
+    STOCK_ROW_OF_BUTTON = 'xpath=ancestor::*[self::li or self::tr][1]'
+    DELETE_WATCHLIST_BUTTON = 'button:has-text("delete watchlist")'
+    SUCCESS_MESSAGE = ':text("success"), :text("added"), :text("created")'
+    ERROR_MESSAGE = ':text("error"), :text("failed"), :text("already exists")'
 
     def __init__(self, page: Page):
         """Initialize watchlist page.
@@ -31,9 +35,9 @@ class WatchlistPage(BasePage):
         self.url = self.settings.watchlists_url
 
     def navigate(self):
-        """Navigate to watchlist page."""
+        """Navigate to watchlist page and wait for it to render."""
         self.goto(self.url)
-        self.wait_for_url('/watchlists')
+        self.wait_until_visible([self.CREATE_WATCHLIST_BUTTON])
 
     def is_loaded(self) -> bool:
         """Check if watchlist page is fully loaded.
@@ -41,8 +45,7 @@ class WatchlistPage(BasePage):
         Returns:
             True if page is loaded, False otherwise
         """
-        self.wait_for_timeout(2000)
-        return self.is_visible(self.PAGE_HEADER)
+        return self.wait_until_visible([self.PAGE_HEADER])
 
     def is_create_button_visible(self) -> bool:
         """Check if create watchlist button is visible.
@@ -55,7 +58,7 @@ class WatchlistPage(BasePage):
     def click_create_watchlist(self):
         """Click create watchlist button."""
         self.click(self.CREATE_WATCHLIST_BUTTON)
-        self.wait_for_timeout(1000)
+        self.wait_until_visible([self.WATCHLIST_NAME_INPUT])
 
     def fill_watchlist_name(self, name: str):
         """Fill watchlist name input.
@@ -66,10 +69,12 @@ class WatchlistPage(BasePage):
         self.fill(self.WATCHLIST_NAME_INPUT, name)
 
     def click_save(self):
-        """Click save button."""
-        if self.element_count(self.SAVE_BUTTON) > 0:
-            self.find_element(self.SAVE_BUTTON).first.click()
-            self.wait_for_timeout(1000)
+        """Click save button.
+
+        Does not wait for the result; callers wait on the element they expect,
+        e.g. expect_watchlist_created().
+        """
+        self.click_first_if_present(self.SAVE_BUTTON)
 
     def create_watchlist(self, name: str):
         """Create a new watchlist.
@@ -77,7 +82,8 @@ class WatchlistPage(BasePage):
         Args:
             name: Watchlist name
         """
-        self.click_create_watchlist()
+        # fill() waits for the name input itself, so skip the modal wait
+        self.click(self.CREATE_WATCHLIST_BUTTON)
         self.fill_watchlist_name(name)
         self.click_save()
 
@@ -98,13 +104,12 @@ class WatchlistPage(BasePage):
         Returns:
             True if watchlist is displayed, False otherwise
         """
-        return self.is_visible(f'text="{name}"')
+        return self.element_exists(self.text_selector(name))
 
     def click_add_stock(self):
         """Click add stock button."""
-        if self.element_count(self.ADD_STOCK_BUTTON) > 0:
-            self.find_element(self.ADD_STOCK_BUTTON).first.click()
-            self.wait_for_timeout(1000)
+        if self.click_first_if_present(self.ADD_STOCK_BUTTON):
+            self.wait_until_visible([self.STOCK_SYMBOL_INPUT])
 
     def fill_stock_symbol(self, symbol: str):
         """Fill stock symbol input.
@@ -123,6 +128,7 @@ class WatchlistPage(BasePage):
         self.click_add_stock()
         self.fill_stock_symbol(symbol)
         self.click_save()
+        self.wait_until_visible([self.text_selector(symbol)])
 
     def is_stock_in_watchlist(self, symbol: str) -> bool:
         """Check if stock is in watchlist.
@@ -133,19 +139,39 @@ class WatchlistPage(BasePage):
         Returns:
             True if stock is in watchlist, False otherwise
         """
-        return self.is_visible(f'text="{symbol}"')
+        return self.element_exists(self.text_selector(symbol))
 
     def remove_first_stock(self):
-        """Remove first stock from watchlist."""
-        if self.element_count(self.REMOVE_STOCK_BUTTON) > 0:
-            self.find_element(self.REMOVE_STOCK_BUTTON).first.click()
-            self.wait_for_timeout(1000)
+        """Remove first stock from watchlist and wait for its row to go away.
+
+        Does nothing if no stock has a remove button.
+        """
+        button = self.find_element(self.REMOVE_STOCK_BUTTON).first
+        if not button.count():
+            return
+
+        # Track the stock's own row (or the button without list markup), not a global count
+        row = button.locator(self.STOCK_ROW_OF_BUTTON)
+        removed = (row if row.count() else button).element_handle()
+        button.click(timeout=self.timeout)
+        removed.wait_for_element_state('hidden', timeout=self.timeout)
 
     def delete_first_watchlist(self):
         """Delete first watchlist."""
-        if self.element_count(self.DELETE_WATCHLIST_BUTTON) > 0:
-            self.find_element(self.DELETE_WATCHLIST_BUTTON).first.click()
-            self.wait_for_timeout(1000)
+        self._click_first_and_expect_removed(self.DELETE_WATCHLIST_BUTTON)
+
+    def _click_first_and_expect_removed(self, selector: str):
+        """Click the first per-item button and wait until its item is gone.
+
+        Does nothing if no item is present.
+
+        Args:
+            selector: Selector of the button rendered once per item
+        """
+        buttons = self.find_element(selector)
+        count = buttons.count()
+        if count and self.click_first_if_present(selector):
+            expect(buttons).to_have_count(count - 1, timeout=self.timeout)
 
     def is_success_message_displayed(self) -> bool:
         """Check if success message is displayed.
@@ -176,7 +202,10 @@ class WatchlistPage(BasePage):
     def expect_watchlist_created(self, name: str):
         """Assert that watchlist was created.
 
+        The name may also render outside the list (header, toast), so any
+        visible occurrence counts.
+
         Args:
             name: Watchlist name
         """
-        assert self.is_watchlist_displayed(name), f"Watchlist '{name}' should be displayed"
+        expect(self.find_element(self.text_selector(name)).first).to_be_visible(timeout=self.timeout)
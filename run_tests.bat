@@ -83,7 +83,7 @@ if "%TEST_TYPE%"=="smoke" (
     pytest -m regression --html=reports/regression_report.html --self-contained-html
 ) else if "%TEST_TYPE%"=="parallel" (
     echo Running all tests in parallel...
-    pytest -n auto --html=reports/parallel_report.html --self-contained-html
+    pytest -n auto --dist loadfile --html=reports/parallel_report.html --self-contained-html
 ) else if "%TEST_TYPE%"=="all" (
     echo Running all tests...
     pytest --html=reports/test_report.html --self-contained-html
@@ -96,7 +96,7 @@ case $TEST_TYPE in
         ;;
     parallel)
         echo -e "${GREEN}Running all tests in parallel...${NC}"
-        pytest -n auto --html=reports/parallel_report.html --self-contained-html
+        pytest -n auto --dist loadfile --html=reports/parallel_report.html --self-contained-html
         ;;
     all)
         echo -e "${GREEN}Running all tests...${NC}"
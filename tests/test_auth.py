@@ -3,6 +3,7 @@ import pytest
 from playwright.sync_api import Page
 from pages import LoginPage, DashboardPage
 from config import TestData
+from models import User
 
 
 @pytest.mark.auth
@@ -72,20 +73,17 @@ class TestLogin:
         # Check if still on login page
         login_page.expect_on_login_page()
 
-    def test_login_multiple_users(self, page: Page):
+    @pytest.mark.parametrize('user', TestData.get_all_users(), ids=lambda user: user.email)
+    def test_login_multiple_users(self, page: Page, user: User):
         """Test login works for different users."""
         login_page = LoginPage(page)
         dashboard_page = DashboardPage(page)
 
-        for user in TestData.get_all_users():
-            login_page.navigate()
-            login_page.login(user)
-
-            # Should redirect to dashboard
-            dashboard_page.expect_logged_in()
+        login_page.navigate()
+        login_page.login(user)
 
-            # Logout
-            dashboard_page.logout()
+        # Should redirect to dashboard
+        dashboard_page.expect_logged_in()
 
 
 @pytest.mark.auth
@@ -98,6 +96,7 @@ class TestLogout:
         login_page = LoginPage(authenticated_page)
 
         # Verify we're logged in
+        dashboard_page.navigate()
         dashboard_page.expect_logged_in()
 
         # Click logout
@@ -114,14 +113,14 @@ class TestLogout:
         dashboard_page = DashboardPage(authenticated_page)
 
         # Logout
+        dashboard_page.navigate()
         dashboard_page.logout()
 
         # Check localStorage is cleared
-        token = dashboard_page.get_local_storage_item("token")
-        user = dashboard_page.get_local_storage_item("user")
+        storage = dashboard_page.get_local_storage_items(["token", "user"])
 
-        assert token is None, "Token should be cleared from localStorage"
-        assert user is None, "User should be cleared from localStorage"
+        assert storage["token"] is None, "Token should be cleared from localStorage"
+        assert storage["user"] is None, "User should be cleared from localStorage"
 
 
 @pytest.mark.auth
@@ -160,48 +159,47 @@ class TestRegister:
 class TestProtectedRoutes:
     """Test protected route access."""
 
-    def test_unauthenticated_access_to_dashboard(self, page: Page):
+    def test_unauthenticated_access_to_dashboard(self, unauth_page: Page):
         """Test unauthenticated user cannot access dashboard."""
-        dashboard_page = DashboardPage(page)
-        login_page = LoginPage(page)
+        login_page = LoginPage(unauth_page)
 
-        dashboard_page.navigate()
+        login_page.goto(login_page.settings.dashboard_url)
 
         # Should redirect to login
         login_page.expect_on_login_page()
 
-    def test_unauthenticated_access_to_trading(self, page: Page):
+    def test_unauthenticated_access_to_trading(self, unauth_page: Page):
         """Test unauthenticated user cannot access trading page."""
-        login_page = LoginPage(page)
+        login_page = LoginPage(unauth_page)
 
-        page.goto(login_page.settings.trading_url)
+        login_page.goto(login_page.settings.trading_url)
 
         # Should redirect to login
         login_page.expect_on_login_page()
 
-    def test_unauthenticated_access_to_portfolio(self, page: Page):
+    def test_unauthenticated_access_to_portfolio(self, unauth_page: Page):
         """Test unauthenticated user cannot access portfolio page."""
-        login_page = LoginPage(page)
+        login_page = LoginPage(unauth_page)
 
-        page.goto(login_page.settings.portfolio_url)
+        login_page.goto(login_page.settings.portfolio_url)
 
         # Should redirect to login
         login_page.expect_on_login_page()
 
-    def test_unauthenticated_access_to_watchlists(self, page: Page):
+    def test_unauthenticated_access_to_watchlists(self, unauth_page: Page):
         """Test unauthenticated user cannot access watchlists page."""
-        login_page = LoginPage(page)
+        login_page = LoginPage(unauth_page)
 
-        page.goto(login_page.settings.watchlists_url)
+        login_page.goto(login_page.settings.watchlists_url)
 
         # Should redirect to login
         login_page.expect_on_login_page()
 
-    def test_unauthenticated_access_to_trades(self, page: Page):
+    def test_unauthenticated_access_to_trades(self, unauth_page: Page):
         """Test unauthenticated user cannot access trades page."""
-        login_page = LoginPage(page)
+        login_page = LoginPage(unauth_page)
 
-        page.goto(login_page.settings.trades_url)
+        login_page.goto(login_page.settings.trades_url)
 
         # Should redirect to login
         login_page.expect_on_login_page()
@@ -219,7 +217,7 @@ class TestProtectedRoutes:
         ]
 
         for route in pages_to_test:
-            authenticated_page.goto(route)
-            authenticated_page.wait_for_url(route)
-            # Should not redirect to login
-            assert '/login' not in authenticated_page.url
+            login_page.goto(route)
+            # Should stay on the route instead of redirecting to login
+            login_page.expect_url(route)
+            assert not login_page.is_on_login_page(), f"{route} redirected to login"
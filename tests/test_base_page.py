@@ -0,0 +1,20 @@
+"""Base page helper tests that run against static content."""
+import pytest
+from playwright.sync_api import Page
+from pages.base_page import BasePage
+from utils.helpers import extract_number_from_text
+
+
+@pytest.mark.regression
+class TestNumberExtraction:
+    """Test in-page and Python number extraction agree."""
+
+    @pytest.mark.parametrize('text', ['$1,234.56', '-12.5%', 'N/A'])
+    def test_visible_number_matches_text_extraction(self, page: Page, text: str):
+        """Test get_visible_number parses text the same way as extract_number_from_text."""
+        page.set_content(f'<span id="value">{text}</span>')
+        base_page = BasePage(page)
+
+        expected = extract_number_from_text(text)
+        assert base_page.extract_number_from_text(text) == expected
+        assert base_page.get_visible_number('#value') == expected
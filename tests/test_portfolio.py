@@ -9,17 +9,17 @@ from pages import PortfolioPage
 class TestPortfolioPageLoad:
     """Test portfolio page loading."""
 
-    def test_portfolio_page_loads(self, authenticated_page: Page):
+    def test_portfolio_page_loads(self, mocked_page: Page):
         """Test portfolio page loads successfully."""
-        portfolio_page = PortfolioPage(authenticated_page)
+        portfolio_page = PortfolioPage(mocked_page)
         portfolio_page.navigate()
 
         # Verify portfolio page is loaded
         portfolio_page.expect_portfolio_page_loaded()
 
-    def test_portfolio_metrics_displayed(self, authenticated_page: Page):
+    def test_portfolio_metrics_displayed(self, mocked_page: Page):
         """Test portfolio metrics are displayed."""
-        portfolio_page = PortfolioPage(authenticated_page)
+        portfolio_page = PortfolioPage(mocked_page)
         portfolio_page.navigate()
 
         # Metrics should be displayed
@@ -30,9 +30,9 @@ class TestPortfolioPageLoad:
 class TestPortfolioPositions:
     """Test portfolio positions display."""
 
-    def test_positions_displayed(self, authenticated_page: Page):
+    def test_positions_displayed(self, mocked_page: Page):
         """Test positions are displayed if user has holdings."""
-        portfolio_page = PortfolioPage(authenticated_page)
+        portfolio_page = PortfolioPage(mocked_page)
         portfolio_page.navigate()
 
         # Check if positions or empty state is displayed
@@ -41,9 +41,9 @@ class TestPortfolioPositions:
 
         assert has_positions or is_empty, "Either positions or empty state should be displayed"
 
-    def test_position_details(self, authenticated_page: Page):
+    def test_position_details(self, mocked_page: Page):
         """Test position details are shown."""
-        portfolio_page = PortfolioPage(authenticated_page)
+        portfolio_page = PortfolioPage(mocked_page)
         portfolio_page.navigate()
 
         if portfolio_page.are_positions_displayed():
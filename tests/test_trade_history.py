@@ -9,17 +9,17 @@ from pages import TradeHistoryPage
 class TestTradeHistoryPageLoad:
     """Test trade history page loading."""
 
-    def test_trade_history_page_loads(self, authenticated_page: Page):
+    def test_trade_history_page_loads(self, mocked_page: Page):
         """Test trade history page loads successfully."""
-        trade_history_page = TradeHistoryPage(authenticated_page)
+        trade_history_page = TradeHistoryPage(mocked_page)
         trade_history_page.navigate()
 
         # Verify trade history page is loaded
         trade_history_page.expect_trade_history_page_loaded()
 
-    def test_trades_or_empty_state_displayed(self, authenticated_page: Page):
+    def test_trades_or_empty_state_displayed(self, mocked_page: Page):
         """Test either trades or empty state is displayed."""
-        trade_history_page = TradeHistoryPage(authenticated_page)
+        trade_history_page = TradeHistoryPage(mocked_page)
         trade_history_page.navigate()
 
         # Either trades or empty state should be shown
@@ -33,18 +33,18 @@ class TestTradeHistoryPageLoad:
 class TestTradeHistoryDisplay:
     """Test trade history display."""
 
-    def test_trade_details_displayed(self, authenticated_page: Page):
+    def test_trade_details_displayed(self, mocked_page: Page):
         """Test trade details are displayed."""
-        trade_history_page = TradeHistoryPage(authenticated_page)
+        trade_history_page = TradeHistoryPage(mocked_page)
         trade_history_page.navigate()
 
         if trade_history_page.are_trades_displayed():
             # Trade count should be positive
             assert trade_history_page.get_trade_count() > 0, "Should have trades"
 
-    def test_timestamps_displayed(self, authenticated_page: Page):
+    def test_timestamps_displayed(self, mocked_page: Page):
         """Test timestamps are displayed for trades."""
-        trade_history_page = TradeHistoryPage(authenticated_page)
+        trade_history_page = TradeHistoryPage(mocked_page)
         trade_history_page.navigate()
 
         if trade_history_page.are_trades_displayed():
@@ -63,7 +63,7 @@ class TestTradeHistorySorting:
 
         # Check sort button
         if trade_history_page.are_trades_displayed():
-            trade_history_page.wait_for_timeout(1000)
+            trade_history_page.expect_sort_button_visible()
 
 
 @pytest.mark.trades
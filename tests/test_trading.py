@@ -69,10 +69,10 @@ class TestBuyTrade:
         trading_page.navigate()
 
         # Execute buy trade
-        trading_page.execute_buy_trade(quantity=TestData.DEFAULT_TRADE_QUANTITY)
+        trading_page.execute_buy_trade(quantity=TestData.DEFAULT_TRADE_QUANTITY, wait_for_success=False)
 
         # Wait for completion
-        trading_page.wait_for_timeout(2000)
+        assert trading_page.wait_for_trade_result(), "Trade result should be shown"
 
     def test_cancel_buy_trade(self, authenticated_page: Page):
         """Test canceling a buy trade."""
@@ -97,10 +97,10 @@ class TestSellTrade:
         trading_page.navigate()
 
         # Execute sell trade
-        trading_page.execute_sell_trade(quantity=TestData.SMALL_TRADE_QUANTITY)
+        trading_page.execute_sell_trade(quantity=TestData.SMALL_TRADE_QUANTITY, wait_for_success=False)
 
         # Wait for completion
-        trading_page.wait_for_timeout(2000)
+        assert trading_page.wait_for_trade_result(), "Trade result should be shown"
 
 
 @pytest.mark.trading
@@ -113,10 +113,10 @@ class TestTradingWorkflows:
         trading_page.navigate()
 
         # Buy shares
-        trading_page.execute_buy_trade(quantity=TestData.DEFAULT_TRADE_QUANTITY)
-        trading_page.wait_for_timeout(3000)
+        trading_page.execute_buy_trade(quantity=TestData.DEFAULT_TRADE_QUANTITY, wait_for_success=False)
+        assert trading_page.wait_for_trade_result(), "Buy trade result should be shown"
 
         # Sell shares
         trading_page.navigate()
-        trading_page.execute_sell_trade(quantity=TestData.SMALL_TRADE_QUANTITY)
-        trading_page.wait_for_timeout(3000)
+        trading_page.execute_sell_trade(quantity=TestData.SMALL_TRADE_QUANTITY, wait_for_success=False)
+        assert trading_page.wait_for_trade_result(), "Sell trade result should be shown"
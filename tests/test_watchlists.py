@@ -1,4 +1,5 @@
 """Watchlists page functional tests using Page Object Model."""
+import uuid
 import pytest
 from playwright.sync_api import Page
 from pages import WatchlistPage
@@ -44,12 +45,12 @@ class TestCreateWatchlist:
         watchlist_page = WatchlistPage(authenticated_page)
         watchlist_page.navigate()
 
-        # Create watchlist
-        watchlist_name = f"Test Watchlist {watchlist_page.get_watchlist_count() + 1}"
+        # Create watchlist with a unique name so runs and parallel workers don't collide
+        watchlist_name = f"Test Watchlist {uuid.uuid4().hex[:8]}"
         watchlist_page.create_watchlist(watchlist_name)
 
-        # Wait for creation
-        watchlist_page.wait_for_timeout(2000)
+        # Wait for the new watchlist to appear
+        watchlist_page.expect_watchlist_created(watchlist_name)
 
     def test_create_watchlist_with_empty_name(self, authenticated_page: Page):
         """Test creating watchlist with empty name shows validation."""
@@ -73,8 +74,9 @@ class TestAddStockToWatchlist:
 
         # Create a watchlist first if needed
         if watchlist_page.get_watchlist_count() == 0:
-            watchlist_page.create_watchlist("My Watchlist")
-            watchlist_page.wait_for_timeout(2000)
+            watchlist_name = f"My Watchlist {uuid.uuid4().hex[:8]}"
+            watchlist_page.create_watchlist(watchlist_name)
+            watchlist_page.expect_watchlist_created(watchlist_name)
 
     def test_add_stock_to_watchlist(self, authenticated_page: Page):
         """Test adding a stock to watchlist."""
@@ -83,8 +85,9 @@ class TestAddStockToWatchlist:
 
         # Create watchlist if needed
         if watchlist_page.get_watchlist_count() == 0:
-            watchlist_page.create_watchlist("Tech Stocks")
-            watchlist_page.wait_for_timeout(2000)
+            watchlist_name = f"Tech Stocks {uuid.uuid4().hex[:8]}"
+            watchlist_page.create_watchlist(watchlist_name)
+            watchlist_page.expect_watchlist_created(watchlist_name)
 
 
 @pytest.mark.watchlist
@@ -97,7 +100,7 @@ class TestRemoveStockFromWatchlist:
         watchlist_page.navigate()
 
         # Wait for page to load
-        watchlist_page.wait_for_timeout(2000)
+        watchlist_page.expect_watchlist_page_loaded()
 
 
 @pytest.mark.watchlist
@@ -110,4 +113,4 @@ class TestDeleteWatchlist:
         watchlist_page.navigate()
 
         # Wait for page to load
-        watchlist_page.wait_for_timeout(2000)
+        watchlist_page.expect_watchlist_page_loaded()
@@ -1,13 +1,18 @@
 """Helper utilities for tests."""
+import re
+from functools import lru_cache
+from typing import Optional
 from playwright.sync_api import Page, expect
 
+_NUMBER_STRIP_RE = re.compile(r'[^0-9.\-]')
 
-def wait_for_url(page: Page, url: str, timeout: int = 30000):
+
+def wait_for_url(page: Page, url: str, timeout: Optional[int] = None):
     """Wait for page to navigate to specific URL."""
     page.wait_for_url(url, timeout=timeout)
 
 
-def wait_for_element(page: Page, selector: str, timeout: int = 30000):
+def wait_for_element(page: Page, selector: str, timeout: Optional[int] = None):
     """Wait for element to be visible."""
     page.wait_for_selector(selector, state='visible', timeout=timeout)
 
@@ -32,9 +37,9 @@ def element_exists(page: Page, selector: str) -> bool:
     return page.locator(selector).count() > 0
 
 
-def wait_for_navigation(page: Page, timeout: int = 30000):
+def wait_for_navigation(page: Page, timeout: Optional[int] = None):
     """Wait for page navigation to complete."""
-    page.wait_for_load_state('networkidle', timeout=timeout)
+    page.wait_for_load_state('domcontentloaded', timeout=timeout)
 
 
 def take_screenshot(page: Page, name: str):
@@ -42,14 +47,14 @@ def take_screenshot(page: Page, name: str):
     page.screenshot(path=f"reports/screenshots/{name}.png")
 
 
+@lru_cache(maxsize=1024)
 def extract_number_from_text(text: str) -> float:
     """Extract number from text like '$1,234.56' -> 1234.56"""
-    import re
-    cleaned = re.sub(r'[^0-9.-]', '', text)
+    cleaned = _NUMBER_STRIP_RE.sub('', text)
     return float(cleaned) if cleaned else 0.0
 
 
-def wait_for_api_response(page: Page, url_pattern: str, timeout: int = 30000):
+def wait_for_api_response(page: Page, url_pattern: str, timeout: Optional[int] = None):
     """Wait for specific API response."""
     with page.expect_response(url_pattern, timeout=timeout) as response_info:
         response = response_info.value